@@ -1,12 +1,46 @@
 #!/usr/bin/env python3
-import os, sys, json, math, glob, datetime as dt
+import functools, io, os, re, sys, json, math, glob, datetime as dt
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 import yaml
 
+try:
+    from yaml import CSafeLoader as YamlLoader  # libyaml, ~10x faster
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
+try:
+    import ahocorasick  # pyahocorasick: C-level multi-pattern matching
+except ImportError:
+    ahocorasick = None
+
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pacsv
+except ImportError:
+    pa = None
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+try:
+    import orjson  # C JSON encoder, writes UTF-8 bytes directly
+except ImportError:
+    orjson = None
+
+try:
+    import tabulate  # required by DataFrame.to_markdown
+except ImportError:
+    tabulate = None
+
 ROOT = Path(__file__).resolve().parents[1]
 DATA_DIR = ROOT / "data" / "transactions"
+CACHE_DIR = ROOT / ".cache"
 CFG_PATH = ROOT / "config" / "budget_rules.yml"
 DOCS_DIR = ROOT / "docs"
 REPORT_MD = DOCS_DIR / "finance_report.md"
@@ -14,68 +48,208 @@ ALERTS_JSON = DOCS_DIR / "alerts.json"
 
 DOCS_DIR.mkdir(parents=True, exist_ok=True)
 
+WS_RE = re.compile(r"\s+")
+
+def _dump_json(obj) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(obj, indent=2).encode("utf-8")
+
+if njit is not None:
+    @njit(cache=True)
+    def _masked_sum_by_code(codes, amounts, mask, k):
+        out = np.zeros(k)
+        for i in range(codes.size):
+            if mask[i] and codes[i] >= 0:
+                out[codes[i]] += amounts[i]
+        return out
+else:
+    def _masked_sum_by_code(codes, amounts, mask, k):
+        keep = mask & (codes >= 0)
+        return np.bincount(codes[keep], weights=amounts[keep], minlength=k)
+
+@functools.lru_cache(maxsize=4)
+def _load_cfg_cached(cfg_key):
+    with open(CFG_PATH, "r", encoding="utf-8") as f:
+        return yaml.load(f, Loader=YamlLoader) or {}
+
 def load_cfg():
     if not CFG_PATH.exists():
         raise SystemExit(f"Missing config at {CFG_PATH}")
-    with open(CFG_PATH, "r", encoding="utf-8") as f:
-        return yaml.safe_load(f) or {}
+    # Same (path, mtime) keying as _compiled_rules: reparse only on change
+    return _load_cfg_cached((str(CFG_PATH), os.path.getmtime(CFG_PATH)))
+
+TX_COLUMNS = ["date", "amount", "description", "currency", "account", "source_file"]
+
+# Known header spellings across banks, mapped to canonical names
+COLUMN_ALIASES = {
+    "date": "date", "booking date": "date", "datum": "date",
+    "amount": "amount", "betrag": "amount", "value": "amount",
+    "description": "description", "verwendungszweck": "description",
+    "description 1": "description", "merchant": "description",
+    "currency": "currency", "währung": "currency",
+    "account": "account", "konto": "account",
+}
+
+def _cache_key(fp):
+    st = os.stat(fp)
+    return CACHE_DIR / f"{os.path.basename(fp)}.{st.st_mtime_ns}.{st.st_size}.parquet"
+
+def _parse_one(fp):
+    # Parquet sidecar keyed by mtime+size: unchanged files skip the CSV parse
+    cache_fp = _cache_key(fp)
+    if cache_fp.exists():
+        try:
+            return pd.read_parquet(cache_fp, columns=TX_COLUMNS)
+        except Exception:
+            pass  # truncated sidecar or missing parquet engine; re-parse the CSV
+
+    # Cheap header peek: one pass over the columns resolves every alias
+    resolved = {}
+    for c in pd.read_csv(fp, nrows=0).columns:
+        canon = COLUMN_ALIASES.get(c.lower().strip())
+        if canon and canon not in resolved:
+            resolved[canon] = c
+    date_col = resolved.get("date")
+    amt_col  = resolved.get("amount")
+    desc_col = resolved.get("description")
+    curr_col = resolved.get("currency")
+    acct_col = resolved.get("account")
+
+    if not (date_col and amt_col and desc_col):
+        raise SystemExit(f"CSV {fp} missing required columns")
+
+    wanted = [c for c in (date_col, amt_col, desc_col, curr_col, acct_col) if c]
+    df = None
+    if pa is not None:
+        try:
+            tbl = pacsv.read_csv(
+                fp,
+                convert_options=pacsv.ConvertOptions(
+                    include_columns=wanted,
+                    column_types={date_col: pa.timestamp("ns"), amt_col: pa.float64()},
+                ),
+            )
+            df = tbl.to_pandas()
+        except (pa.ArrowInvalid, ValueError):
+            df = None  # malformed values; let pandas coerce below
+    if df is None:
+        df = pd.read_csv(fp, usecols=wanted)
+
+    tmp = pd.DataFrame({
+        "date": pd.to_datetime(df[date_col], errors="coerce"),
+        "amount": pd.to_numeric(df[amt_col], errors="coerce"),
+        "description": df[desc_col].astype(str),
+        "currency": (df[curr_col].astype(str) if curr_col else "N/A"),
+        "account": (df[acct_col].astype(str) if acct_col else "N/A"),
+        "source_file": os.path.basename(fp),
+    }).dropna(subset=["date", "amount"])
+
+    # Bank exports are usually time-ordered already, so this is near free
+    # and turns the global sort below into a no-op check.
+    tmp.sort_values("date", kind="mergesort", inplace=True, ignore_index=True)
+
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        for stale in CACHE_DIR.glob(os.path.basename(fp) + ".*.parquet"):
+            stale.unlink()
+        tmp.to_parquet(cache_fp, compression="zstd")
+    except Exception:
+        pass  # cache is best-effort; no parquet engine means no sidecar
+
+    return tmp
 
 def load_transactions():
     files = sorted(glob.glob(str(DATA_DIR / "*.csv")))
     if not files:
         raise SystemExit(f"No CSVs found in {DATA_DIR}")
-    dfs = []
-    for fp in files:
-        df = pd.read_csv(fp)
-        cols = {c.lower().strip(): c for c in df.columns}
-
-        # Normalize column names (best-effort across banks)
-        date_col = next((cols[k] for k in cols if k in {"date", "booking date", "datum"}), None)
-        amt_col  = next((cols[k] for k in cols if k in {"amount", "betrag", "value"}), None)
-        desc_col = next((cols[k] for k in cols if k in {"description", "verwendungszweck", "description 1", "merchant"}), None)
-        curr_col = next((cols[k] for k in cols if k in {"currency", "währung"}), None)
-        acct_col = next((cols[k] for k in cols if k in {"account", "konto"}), None)
-
-        if not (date_col and amt_col and desc_col):
-            raise SystemExit(f"CSV {fp} missing required columns")
-
-        tmp = pd.DataFrame({
-            "date": pd.to_datetime(df[date_col], errors="coerce"),
-            "amount": pd.to_numeric(df[amt_col], errors="coerce"),
-            "description": df[desc_col].astype(str),
-            "currency": (df[curr_col].astype(str) if curr_col else "N/A"),
-            "account": (df[acct_col].astype(str) if acct_col else "N/A"),
-            "source_file": os.path.basename(fp),
-        }).dropna(subset=["date", "amount"])
-
-        dfs.append(tmp)
-
-    all_tx = pd.concat(dfs, ignore_index=True).sort_values("date")
+    # Parsing runs in GIL-releasing C kernels, so threads overlap IO + parse
+    with ThreadPoolExecutor(max_workers=min(8, len(files))) as ex:
+        dfs = list(ex.map(_parse_one, files))
+
+    all_tx = pd.concat(dfs, ignore_index=True)
+    # Low-cardinality strings: categorical codes are cheaper to store and
+    # to group by than per-row Python str objects. Converted after concat —
+    # concat of per-file categoricals with differing category sets would
+    # silently fall back to object dtype.
+    all_tx["currency"] = all_tx["currency"].astype("category")
+    all_tx["account"] = all_tx["account"].astype("category")
+    if not all_tx["date"].is_monotonic_increasing:
+        # mergesort exploits the sorted per-file runs instead of resorting
+        all_tx.sort_values("date", kind="mergesort", inplace=True, ignore_index=True)
     if all_tx.empty:
         raise SystemExit("No valid rows found in CSVs after parsing.")
     return all_tx
 
-def categorize(df: pd.DataFrame, cfg: dict) -> pd.DataFrame:
-    rules = cfg.get("categorization", {}) or {}
+def _build_automaton(rules: dict):
+    """Compile all category patterns into one Aho-Corasick automaton.
+
+    Each word carries (priority, category) so ties resolve to the rule
+    that appears first in the config, matching the old loop's semantics.
+    """
+    automaton = ahocorasick.Automaton()
+    priority = 0
+    for cat, patterns in rules.items():
+        for p in (patterns or []):
+            # add_word overwrites duplicates, so skip patterns already
+            # claimed by an earlier category to keep first-match wins
+            if p and p.upper() not in automaton:
+                automaton.add_word(p.upper(), (priority, cat))
+                priority += 1
+    if not priority:
+        return None
+    automaton.make_automaton()
+    return automaton
+
+@functools.lru_cache(maxsize=4)
+def _compiled_rules(cfg_key):
+    """Compile matchers once per (path, mtime) of the rules file.
+
+    A long-lived bot re-categorizing on each cycle skips both the YAML
+    reparse fallout and the automaton/regex builds until the config changes.
+    """
+    rules = load_cfg().get("categorization", {}) or {}
+    automaton = _build_automaton(rules) if ahocorasick is not None else None
+    regexes = []
+    for c, patterns in rules.items():
+        pats = [p for p in (patterns or []) if p]
+        if pats:
+            regexes.append((c, re.compile("|".join(map(re.escape, pats)), re.IGNORECASE)))
+    return automaton, regexes
+
+def categorize(df: pd.DataFrame, cfg: dict) -> None:
     fallback = cfg.get("fallback_category", "Other")
-    cats = []
-    for desc in df["description"].astype(str):
-        d = desc.upper()
-        cat = None
-        for c, patterns in rules.items():
-            for p in (patterns or []):
-                if p and p.upper() in d:
-                    cat = c
-                    break
-            if cat:
-                break
-        cats.append(cat or fallback)
-    out = df.copy()
-    out["category"] = cats
-    return out
+    automaton, regexes = _compiled_rules((str(CFG_PATH), os.path.getmtime(CFG_PATH)))
+    # description is already str from load_transactions; no astype re-copy
+    descs = df["description"].str.upper().to_numpy()
+    if automaton is not None:
+        # One DFA pass per description; iter() runs in C.
+        cats = [
+            min(automaton.iter(d), key=lambda hit: hit[1][0], default=(0, (0, fallback)))[1][1]
+            for d in descs
+        ]
+    else:
+        # One boolean mask per category via pandas' C string kernel,
+        # ordered by rule priority so np.select keeps first-match wins.
+        masks, cats_order = [], []
+        for c, regex in regexes:
+            masks.append(df["description"].str.contains(regex, regex=True, na=False))
+            cats_order.append(c)
+        if masks:
+            cats = np.select(masks, cats_order, default=fallback)
+        else:
+            cats = np.full(len(df), fallback, dtype=object)
+    # Attach in place: copying the whole frame just to add a column would
+    # duplicate every transaction row
+    df["category"] = pd.Categorical(cats)
 
 def compute_kpis(df: pd.DataFrame, cfg: dict):
-    df["month"] = df["date"].dt.to_period("M").dt.to_timestamp()
+    # Compact int month key (year*12+month): comparisons, factorize and
+    # groupby below all run on int32 instead of Period/Timestamp objects
+    df["month_key"] = (
+        df["date"].dt.year.to_numpy().astype(np.int32) * 12
+        + df["date"].dt.month.to_numpy().astype(np.int32)
+    )
     budgets = cfg.get("monthly_budgets", {}) or {}
     income_target = cfg.get("monthly_income_target", None)
     guard = cfg.get("guardrails", {})
@@ -83,23 +257,21 @@ def compute_kpis(df: pd.DataFrame, cfg: dict):
     min_savings_rate = float(guard.get("min_savings_rate", 0.2))
     min_runway = float(guard.get("min_runway_months", 6))
 
-    # Identify income vs expense
-    df["is_expense"] = df["amount"] < 0
-    df["is_income"] = df["amount"] > 0
+    # Identify income vs expense: one int8 sign column (-1 expense,
+    # 1 income) instead of two N-length bool columns
+    df["sign"] = np.sign(df["amount"].to_numpy()).astype(np.int8)
 
     # Current month window (Europe/Brussels)
     today = pd.Timestamp.now(tz="Europe/Brussels").normalize()
-    this_month = today.to_period("M").to_timestamp()
-    month_df = df[df["month"] == this_month]
-
-    # Budgets tracking for current month
-    spend_by_cat = (
-        month_df[month_df["is_expense"]]
-        .groupby("category")["amount"]
-        .sum()
-        .fillna(0)
-        .abs()
-    )
+    this_key = today.year * 12 + today.month
+    month_df = df[df["month_key"] == this_key]
+
+    # Budgets tracking for current month: one fused pass over int-coded
+    # categories instead of a boolean filter + groupby per call
+    codes, uniques = pd.factorize(month_df["category"], sort=False)
+    amounts = month_df["amount"].to_numpy(np.float64)
+    totals = _masked_sum_by_code(codes, amounts, amounts < 0, len(uniques))
+    spend_by_cat = pd.Series(np.abs(totals), index=uniques)
     rows = []
     alerts = []
 
@@ -125,16 +297,23 @@ def compute_kpis(df: pd.DataFrame, cfg: dict):
         })
 
     # Savings rate and runway (based on last 3 fully closed months)
-    closed = df[df["month"] < this_month]
-    last3 = sorted(closed["month"].unique())[-3:]
+    closed = df[df["month_key"] < this_key]
+    # np.unique returns sorted keys plus inverse codes in one C pass —
+    # no Python sort, no isin hash, and the codes feed bincount directly
+    months, mc = np.unique(closed["month_key"].to_numpy(), return_inverse=True)
+    last3 = months[-3:]
     income_3, expense_3 = 0.0, 0.0
-    if last3:
-        recent = closed[closed["month"].isin(last3)]
-        income_3 = recent[recent["is_income"]]["amount"].sum()
-        expense_3 = -recent[recent["is_expense"]]["amount"].sum()
-
-    avg_income = (income_3 / len(last3)) if last3 else (income_target or 0.0)
-    avg_burn = (expense_3 / len(last3)) if last3 else 0.0
+    if last3.size:
+        # One pass over the closed frame: bincount per month for income
+        # and expenses, then slice the last three periods
+        amt = closed["amount"].to_numpy(np.float64)
+        inc_by_m = np.bincount(mc, weights=np.where(amt > 0, amt, 0.0), minlength=len(months))
+        exp_by_m = np.bincount(mc, weights=np.where(amt < 0, -amt, 0.0), minlength=len(months))
+        income_3 = float(inc_by_m[-last3.size:].sum())
+        expense_3 = float(exp_by_m[-last3.size:].sum())
+
+    avg_income = (income_3 / last3.size) if last3.size else (income_target or 0.0)
+    avg_burn = (expense_3 / last3.size) if last3.size else 0.0
     net_month = avg_income - avg_burn
     savings_rate = (net_month / avg_income) if avg_income else 0.0
 
@@ -151,7 +330,8 @@ def compute_kpis(df: pd.DataFrame, cfg: dict):
         baldf = pd.read_csv(balances_csv)
         total_balance = float(baldf.get("balance", pd.Series(dtype=float)).sum())
     else:
-        total_balance = float(df["amount"].cumsum().iloc[-1]) if not df.empty else 0.0
+        # Sum, not cumsum: we only ever read the final running total
+        total_balance = float(df["amount"].to_numpy().sum()) if not df.empty else 0.0
 
     runway_months = (total_balance / avg_burn) if avg_burn > 0 else math.inf
     if runway_months < min_runway:
@@ -162,16 +342,18 @@ def compute_kpis(df: pd.DataFrame, cfg: dict):
         })
 
     # Recurring subscriptions heuristic (top merchants charged 3+ months)
-    expenses = closed[closed["is_expense"]].copy()
-    expenses["merchant"] = expenses["description"].str.upper().str.replace(r"\s+", " ", regex=True)
-    subs = (
-        expenses
-        .groupby(["merchant", "category", "month"])["amount"]
-        .sum().abs().reset_index()
-    )
+    expenses = closed[closed["sign"] == -1]
+    merchant = expenses["description"].str.upper().str.replace(WS_RE, " ", regex=True)
+    # Only distinct (merchant, category, month) triples matter, so dedupe
+    # once and count with a single groupby instead of sum-then-nunique
+    triples = pd.DataFrame({
+        "merchant": merchant,
+        "category": expenses["category"],
+        "month_key": expenses["month_key"],
+    }).drop_duplicates()
     rec = (
-        subs.groupby(["merchant", "category"])["month"]
-            .nunique().reset_index(name="months_charged")
+        triples.groupby(["merchant", "category"], observed=True)
+               .size().reset_index(name="months_charged")
     )
     recurring = (
         rec[rec["months_charged"] >= 3]
@@ -181,12 +363,12 @@ def compute_kpis(df: pd.DataFrame, cfg: dict):
 
     # Unbudgeted categories with spend (help you update budgets)
     unbudgeted_spend = (
-        month_df[month_df["is_expense"] & ~month_df["category"].isin(budgets)]
-        .groupby("category")["amount"].sum().abs().sort_values(ascending=False)
+        month_df[(month_df["sign"] == -1) & ~month_df["category"].isin(budgets)]
+        .groupby("category", observed=True)["amount"].sum().abs().sort_values(ascending=False)
     )
 
     kpis = {
-        "month": str(this_month.date()),
+        "month": str(dt.date(today.year, today.month, 1)),
         "budgets": rows,
         "avg_income": round(avg_income, 2),
         "avg_burn": round(avg_burn, 2),
@@ -204,66 +386,90 @@ def compute_kpis(df: pd.DataFrame, cfg: dict):
 
     return kpis, month_df
 
+def _md_table(tbl: pd.DataFrame) -> str:
+    if tabulate is not None:
+        return tbl.to_markdown(index=False, tablefmt="github")
+    # plain pipe-table fallback when tabulate is not installed
+    lines = ["| " + " | ".join(tbl.columns) + " |",
+             "|" + "|".join("---" for _ in tbl.columns) + "|"]
+    for row in tbl.itertuples(index=False):
+        lines.append("| " + " | ".join(str(v) for v in row) + " |")
+    return "\n".join(lines)
+
 def write_report(kpis, month_df):
-    md = []
-    md.append(f"# 💰 Budget Guardrail Report — {kpis['month']}")
-    md.append("")
-    md.append(f"- **Avg Monthly Income (last 3 closed months):** €{kpis['avg_income']}")
-    md.append(f"- **Avg Monthly Burn (last 3 closed months):** €{kpis['avg_burn']}")
-    md.append(f"- **Net / mo:** €{kpis['net_month']} &nbsp;|&nbsp; **Savings rate:** {kpis['savings_rate_pct']}%")
-    md.append(f"- **Runway:** {kpis['runway_months']} months")
-    md.append("")
-    md.append("## Budgets vs Spend (current month)")
-    md.append("")
-    md.append("| Category | Budget | Spent | Used | Status |")
-    md.append("|---|---:|---:|---:|---|")
-    for r in kpis["budgets"]:
-        used = f"{r['used_pct']}%"
-        status = "🟢 OK" if r["status"] == "OK" else "🔴 ALERT"
-        md.append(f"| {r['category']} | €{r['budget']:.0f} | €{r['spent']:.2f} | {used} | {status} |")
+    # Single growable buffer instead of a list of line fragments
+    buf = io.StringIO()
+    w = buf.write
+    w(f"# 💰 Budget Guardrail Report — {kpis['month']}\n")
+    w("\n")
+    w(f"- **Avg Monthly Income (last 3 closed months):** €{kpis['avg_income']}\n")
+    w(f"- **Avg Monthly Burn (last 3 closed months):** €{kpis['avg_burn']}\n")
+    w(f"- **Net / mo:** €{kpis['net_month']} &nbsp;|&nbsp; **Savings rate:** {kpis['savings_rate_pct']}%\n")
+    w(f"- **Runway:** {kpis['runway_months']} months\n")
+    w("\n")
+    w("## Budgets vs Spend (current month)\n")
+    w("\n")
+    if kpis["budgets"]:
+        b = pd.DataFrame(kpis["budgets"])
+        budgets_tbl = pd.DataFrame({
+            "Category": b["category"],
+            "Budget": b["budget"].map("€{:.0f}".format),
+            "Spent": b["spent"].map("€{:.2f}".format),
+            "Used": b["used_pct"].map("{}%".format),
+            "Status": np.where(b["status"] == "OK", "🟢 OK", "🔴 ALERT"),
+        })
+        w(_md_table(budgets_tbl))
+        w("\n")
 
     if kpis.get("top_recurring_merchants"):
-        md.append("")
-        md.append("## Recurring merchants (≥ 3 months)")
-        md.append("")
-        md.append("| Merchant | Category | Months billed |")
-        md.append("|---|---|---:|")
-        for row in kpis["top_recurring_merchants"]:
-            md.append(f"| {row['merchant'].title()} | {row['category']} | {row['months_charged']} |")
+        w("\n")
+        w("## Recurring merchants (≥ 3 months)\n")
+        w("\n")
+        r = pd.DataFrame(kpis["top_recurring_merchants"])
+        rec_tbl = pd.DataFrame({
+            "Merchant": r["merchant"].str.title(),
+            "Category": r["category"],
+            "Months billed": r["months_charged"],
+        })
+        w(_md_table(rec_tbl))
+        w("\n")
 
     if kpis.get("unbudgeted_spend"):
-        md.append("")
-        md.append("## Unbudgeted categories with spend")
-        md.append("")
-        md.append("| Category | Spent |")
-        md.append("|---|---:|")
-        for row in kpis["unbudgeted_spend"]:
-            md.append(f"| {row['category']} | €{row['spent']:.2f} |")
+        w("\n")
+        w("## Unbudgeted categories with spend\n")
+        w("\n")
+        u = pd.DataFrame(kpis["unbudgeted_spend"])
+        unbudgeted_tbl = pd.DataFrame({
+            "Category": u["category"],
+            "Spent": u["spent"].map("€{:.2f}".format),
+        })
+        w(_md_table(unbudgeted_tbl))
+        w("\n")
 
     if kpis["alerts"]:
-        md.append("")
-        md.append("## ⚠️ Alerts")
+        w("\n")
+        w("## ⚠️ Alerts\n")
         for a in kpis["alerts"]:
             if a["type"] == "overspend":
-                md.append(f"- **Overspend:** {a['category']} at €{a['spent']:.2f} / €{a['budget']:.0f} ({a['ratio']*100:.0f}% of budget)")
+                w(f"- **Overspend:** {a['category']} at €{a['spent']:.2f} / €{a['budget']:.0f} ({a['ratio']*100:.0f}% of budget)\n")
             elif a["type"] == "low_savings_rate":
-                md.append(f"- **Low savings rate:** {a['savings_rate']}% (target ≥ {a['threshold_pct']}%)")
+                w(f"- **Low savings rate:** {a['savings_rate']}% (target ≥ {a['threshold_pct']}%)\n")
             elif a["type"] == "short_runway":
-                md.append(f"- **Short runway:** {a['runway_months']} months (target ≥ {a['threshold_months']} months)")
+                w(f"- **Short runway:** {a['runway_months']} months (target ≥ {a['threshold_months']} months)\n")
     else:
-        md.append("")
-        md.append("## ✅ No alerts this cycle")
+        w("\n")
+        w("## ✅ No alerts this cycle\n")
 
-    REPORT_MD.write_text("\n".join(md), encoding="utf-8")
-    ALERTS_JSON.write_text(json.dumps(kpis["alerts"], indent=2), encoding="utf-8")
+    REPORT_MD.write_text(buf.getvalue().rstrip("\n"), encoding="utf-8")
+    ALERTS_JSON.write_bytes(_dump_json(kpis["alerts"]))
 
 def main():
     cfg = load_cfg()
     df = load_transactions()
-    df = categorize(df, cfg)
+    categorize(df, cfg)
     kpis, month_df = compute_kpis(df, cfg)
     write_report(kpis, month_df)
-    print(json.dumps(kpis, indent=2))
+    sys.stdout.buffer.write(_dump_json(kpis) + b"\n")
 
 if __name__ == "__main__":
     try: